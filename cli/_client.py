@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import sys
+import tempfile
+from functools import cache
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import typer
+
+
+ENV_CACHE_PATH = Path.home() / ".cache" / "iot-jobs-cli" / "env.pkl"
+
+PROJECT_ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
+
+
+def resolve_env_path() -> Path:
+    cwd_env_path = Path.cwd() / ".env"
+
+    if cwd_env_path.is_file():
+        return cwd_env_path
+
+    return PROJECT_ENV_PATH
+
+
+def parse_env_file(path: Path) -> dict:
+    env_vars = {}
+
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+
+    for line in lines:
+        line = line.strip()
+
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+
+        key, _, value = line.partition("=")
+
+        key = key.strip()
+        value = value.strip().strip("'\"")
+
+        if key:
+            env_vars[key] = value
+
+    return env_vars
+
+
+def load_env_file(path: Path | None = None) -> None:
+    if path is None:
+        path = resolve_env_path()
+
+    path = path.resolve()
+
+    try:
+        env_mtime = os.stat(path).st_mtime
+
+    except OSError:
+        return
+
+    env_vars = None
+
+    try:
+        cached = pickle.loads(ENV_CACHE_PATH.read_bytes())
+
+        if cached["path"] == str(path) and cached["mtime"] == env_mtime:
+            env_vars = cached["vars"]
+
+    except Exception:
+        pass
+
+    if env_vars is None:
+        env_vars = parse_env_file(path)
+
+        try:
+            ENV_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(dir=ENV_CACHE_PATH.parent)
+
+            try:
+                os.write(
+                    fd,
+                    pickle.dumps(
+                        {"path": str(path), "mtime": env_mtime, "vars": env_vars}
+                    )
+                )
+
+            finally:
+                os.close(fd)
+
+            os.replace(tmp_path, ENV_CACHE_PATH)
+
+        except OSError:
+            pass
+
+    for key, value in env_vars.items():
+        if key not in os.environ:
+            os.environ[key] = value
+
+
+load_env_file()
+
+API_CLIENT_HOST = os.getenv("API_CLIENT_HOST", None)
+
+if API_CLIENT_HOST is None:
+    typer.echo(
+        "Error: API_CLIENT_HOST environment variable is not set.",
+        err=True
+    )
+
+    sys.exit(1)
+
+
+@cache
+def patch_client_json() -> None:
+    import openapi_client.api_client
+    import openapi_client.rest
+
+    json_shim = SimpleNamespace(
+        loads=orjson.loads,
+        dumps=lambda obj, **kwargs: orjson.dumps(
+            obj,
+            default=kwargs.get("default")
+        ).decode(),
+        JSONDecodeError=orjson.JSONDecodeError
+    )
+
+    openapi_client.rest.json = json_shim
+    openapi_client.api_client.json = json_shim
+
+
+@cache
+def get_api_client():
+    from openapi_client import ApiClient, Configuration
+
+    patch_client_json()
+
+    configuration = Configuration(
+        host=API_CLIENT_HOST
+    )
+
+    configuration.connection_pool_maxsize = 16
+
+    return ApiClient(
+        configuration=configuration
+    )
+
+
+@cache
+def get_devices_api():
+    from openapi_client.api import DevicesApi
+
+    return DevicesApi(
+        api_client=get_api_client()
+    )
+
+
+@cache
+def get_mongodb_api():
+    from openapi_client.api import MongodbApi
+
+    return MongodbApi(
+        api_client=get_api_client()
+    )
@@ -1,51 +1,14 @@
 # -*- coding: utf-8 -*-
 
-import json
-import os
+import shlex
 import sys
-from functools import wraps
+from functools import cache
 
+import orjson
 import typer
-from dotenv import load_dotenv
-
-from openapi_client import ApiClient, Configuration
-from openapi_client.api import DevicesApi
-from openapi_client.exceptions import ApiException
-from openapi_client.models import (
-    DateRangeFilter,
-    DeviceSearchFilter,
-    ErrorModel,
-    ImeiFilter,
-    JobQueueFilter,
-    LastSeenAtFilter,
-    PostDevicesRequest,
-    PostDevicesSearchRequest
-)
-
-
-load_dotenv()
-
-API_CLIENT_HOST = os.getenv("API_CLIENT_HOST", None)
-
-if API_CLIENT_HOST is None:
-    typer.echo(
-        "Error: API_CLIENT_HOST environment variable is not set.",
-        err=True
-    )
-
-    sys.exit(1)
 
-configuration = Configuration(
-    host=API_CLIENT_HOST
-)
+from _client import get_devices_api
 
-api_client = ApiClient(
-    configuration=configuration
-)
-
-devices_api = DevicesApi(
-    api_client=api_client
-)
 
 app = typer.Typer(help="IoT Jobs CLI")
 
@@ -54,89 +17,160 @@ devices_app = typer.Typer(help="Manage IoT Devices.")
 app.add_typer(devices_app, name="devices")
 
 
-def handle_api_call(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        try:
-            return func(*args, **kwargs)
+GREEN_BOLD = b"\x1b[1;32m"
+RED_BOLD = b"\x1b[1;31m"
+BOLD = b"\x1b[1m"
+RESET = b"\x1b[0m"
 
-        except ApiException as e:
-            print_error(e)
 
-            sys.exit(1)
+def write_styled(payload: bytes, style: bytes, err: bool = False) -> None:
+    stream = sys.stderr if err else sys.stdout
 
-        except Exception as e:
-            typer.secho(
-                f"Unexpected error: {e}",
-                fg=typer.colors.RED,
-                bold=True,
-                err=True
-            )
+    if stream.isatty():
+        stream.buffer.write(style + payload + RESET + b"\n")
 
-            sys.exit(1)
+    else:
+        stream.buffer.write(payload + b"\n")
 
-    return wrapper
+    stream.flush()
 
 
 def print_success(message: str, model=None) -> None:
-    typer.secho(
-        message,
-        fg=typer.colors.GREEN,
-        bold=True
-    )
+    write_styled(message.encode(), GREEN_BOLD)
 
     if model is not None:
-        typer.secho(
-            model.model_dump_json(indent=4, exclude_none=False),
-            bold=True
+        write_styled(
+            model.__pydantic_serializer__.to_json(
+                model,
+                indent=4,
+                exclude_none=False
+            ),
+            BOLD
         )
 
 
-def print_error(e: ApiException) -> None:
-    typer.secho(
-        f"Error: {e.status} {e.reason}",
-        fg=typer.colors.RED,
-        bold=True
+def print_error(e) -> None:
+    write_styled(
+        f"Error: {e.status} {e.reason}".encode(),
+        RED_BOLD,
+        err=True
     )
 
     if e.body is not None:
-        error = ErrorModel(**json.loads(e.body).get("error", {}))
-
-        typer.secho(
-            json.dumps({"error": error.model_dump()}, indent=4),
-            bold=True,
+        write_styled(
+            orjson.dumps(
+                orjson.loads(e.body),
+                option=orjson.OPT_INDENT_2
+            ),
+            BOLD,
             err=True
         )
 
 
-def parse_json_str(json_str: str):
+def parse_json_str(json_str: str | bytes | None) -> dict | None:
+    if not json_str:
+        return None
+
     try:
-        return json.loads(json_str)
+        return orjson.loads(json_str)
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         typer.echo(
-            f"Error: Invalid JSON string: {json_str}",
+            f"Error: Invalid JSON string: {json_str!r}",
             err=True
         )
 
         sys.exit(1)
 
 
+@cache
+def get_filter_builders():
+    from openapi_client.models import (
+        DateRangeFilter,
+        ImeiFilter,
+        JobQueueFilter,
+        LastSeenAtFilter
+    )
+
+    return {
+        "imei": lambda f: ImeiFilter(
+            **({"var_in": f["in"]} if "in" in f else {})
+        ),
+        "created_at": lambda f: DateRangeFilter(
+            **{k: f[k] for k in ("gte", "lte") if k in f}
+        ),
+        "updated_at": lambda f: DateRangeFilter(
+            **{k: f[k] for k in ("gte", "lte") if k in f}
+        ),
+        "last_seen_at": lambda f: LastSeenAtFilter(
+            **{k: f[k] for k in ("is_empty", "gte", "lte") if k in f}
+        ),
+        "job_queue": lambda f: JobQueueFilter(
+            **{k: f[k] for k in ("is_empty", "contains_any") if k in f}
+        )
+    }
+
+
+@app.command("batch")
+def run_batch(
+    file: typer.FileText = typer.Argument(
+        default=...,
+        help="File with one subcommand invocation per line (e.g. 'devices get 123456789012345')."
+    )
+) -> None:
+    failed = False
+
+    for line in file:
+        line = line.strip()
+
+        if not line or line.startswith("#"):
+            continue
+
+        typer.echo(f"> {line}")
+
+        try:
+            app(args=shlex.split(line), standalone_mode=False)
+
+        except SystemExit as e:
+            if e.code not in (0, None):
+                failed = True
+
+            continue
+
+        except Exception as e:
+            from openapi_client.exceptions import ApiException
+
+            if isinstance(e, ApiException):
+                print_error(e)
+
+            else:
+                typer.echo(
+                    f"Error running '{line}': {e}",
+                    err=True
+                )
+
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
 @devices_app.command("create")
-@handle_api_call
 def create_device(
     imei: str = typer.Argument(
         default=...,
         help="15-digit IMEI."
     )
 ) -> None:
+    from openapi_client.models import PostDevicesRequest
+
     typer.echo(f"Attempting to create device with IMEI: {imei}")
 
     post_devices_request = PostDevicesRequest(
         imei=imei
     )
 
-    response = devices_api.post_devices_v1_devices_post(
+    response = get_devices_api().post_devices_v1_devices_post(
         post_devices_request=post_devices_request
     )
 
@@ -144,7 +178,6 @@ def create_device(
 
 
 @devices_app.command("get")
-@handle_api_call
 def get_device(
     imei: str = typer.Argument(
         default=...,
@@ -153,7 +186,7 @@ def get_device(
 ) -> None:
     typer.echo(f"Getting details for device with IMEI: {imei}")
 
-    response = devices_api.get_devices_v1_devices_imei_get(
+    response = get_devices_api().get_devices_v1_devices_imei_get(
         imei=imei
     )
 
@@ -161,7 +194,6 @@ def get_device(
 
 
 @devices_app.command("delete")
-@handle_api_call
 def delete_device(
     imei: str = typer.Argument(
         default=...,
@@ -170,7 +202,7 @@ def delete_device(
 ) -> None:
     typer.echo(f"Attempting to delete device with IMEI: {imei}")
 
-    devices_api.delete_devices_v1_devices_imei_delete(
+    get_devices_api().delete_devices_v1_devices_imei_delete(
         imei=imei
     )
 
@@ -178,16 +210,20 @@ def delete_device(
 
 
 @devices_app.command("search")
-@handle_api_call
 def search_devices(
     filter: str | None = typer.Option(
         None,
         "--filter",
         "-f",
         help="Search filter JSON string.",
-        callback=lambda x: parse_json_str(x) if x else None
+        callback=parse_json_str
     )
 ) -> None:
+    from openapi_client.models import (
+        DeviceSearchFilter,
+        PostDevicesSearchRequest
+    )
+
     typer.echo("Searching for devices...")
 
     post_devices_search_request = PostDevicesSearchRequest()
@@ -195,50 +231,30 @@ def search_devices(
     if filter is not None:
         device_search_filter_obj = DeviceSearchFilter()
 
-        if "imei" in filter:
-            device_search_filter_obj.imei = ImeiFilter(
-                var_in=filter["imei"].get("in")
-            )
+        filter_builders = get_filter_builders()
 
-        if "created_at" in filter:
-            device_search_filter_obj.created_at = DateRangeFilter(
-                gte=filter["created_at"].get("gte"),
-                lte=filter["created_at"].get("lte")
-            )
-
-        if "updated_at" in filter:
-            device_search_filter_obj.updated_at = DateRangeFilter(
-                gte=filter["updated_at"].get("gte"),
-                lte=filter["updated_at"].get("lte")
-            )
-
-        if "last_seen_at" in filter:
-            device_search_filter_obj.last_seen_at = LastSeenAtFilter(
-                is_empty=filter["last_seen_at"].get("is_empty"),
-                gte=filter["last_seen_at"].get("gte"),
-                lte=filter["last_seen_at"].get("lte")
-            )
-
-        if "job_queue" in filter:
-            device_search_filter_obj.job_queue = JobQueueFilter(
-                is_empty=filter["job_queue"].get("is_empty"),
-                contains_any=filter["job_queue"].get("contains_any")
+        for field in filter_builders.keys() & filter.keys():
+            setattr(
+                device_search_filter_obj,
+                field,
+                filter_builders[field](filter[field])
             )
 
         post_devices_search_request.filter = device_search_filter_obj
 
-    response = devices_api.post_devices_search_v1_devices_search_post(
+    response = get_devices_api().post_devices_search_v1_devices_search_post(
         post_devices_search_request=post_devices_search_request
     )
 
     if response.devices:
         print_success(f"Found {len(response.devices)} devices:")
 
-        for device in response.devices:
-            typer.secho(
-                device.model_dump_json(indent=4, exclude_none=False),
-                bold=True
-            )
+        payload = orjson.dumps(
+            [device.model_dump() for device in response.devices],
+            option=orjson.OPT_INDENT_2
+        )
+
+        write_styled(payload, BOLD)
 
     else:
         typer.secho(
@@ -247,5 +263,26 @@ def search_devices(
         )
 
 
+def main() -> None:
+    try:
+        app()
+
+    except Exception as e:
+        from openapi_client.exceptions import ApiException
+
+        if isinstance(e, ApiException):
+            print_error(e)
+
+        else:
+            typer.secho(
+                f"Unexpected error: {e}",
+                fg=typer.colors.RED,
+                bold=True,
+                err=True
+            )
+
+        sys.exit(1)
+
+
 if __name__ == "__main__":
-    app()
+    main()
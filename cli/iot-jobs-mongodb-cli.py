@@ -4,43 +4,12 @@ import json
 import os
 import sys
 
+import orjson
 import typer
-from dotenv import load_dotenv
 
-from openapi_client import ApiClient, Configuration
-from openapi_client.api import MongodbApi
-from openapi_client.models import (
-    PostCollectionsIndexRequest,
-    PostCollectionsRequest,
-    PutCollectionsValidatorRequest
-)
-from openapi_client.exceptions import ApiException
+from _client import get_mongodb_api
 
 
-load_dotenv()
-
-API_CLIENT_HOST = os.getenv("API_CLIENT_HOST", None)
-
-if API_CLIENT_HOST is None:
-    typer.echo(
-        "Error: API_CLIENT_HOST environment variable is not set.",
-        err=True
-    )
-
-    sys.exit(1)
-
-configuration = Configuration(
-    host=API_CLIENT_HOST
-)
-
-api_client = ApiClient(
-    configuration=configuration
-)
-
-mongodb_api = MongodbApi(
-    api_client=api_client
-)
-
 app = typer.Typer(help="IoT Jobs MongoDB CLI")
 
 collection_app = typer.Typer(help="Manage MongoDB collections.")
@@ -59,6 +28,9 @@ def create_collection(
         help="Name of the collection to create."
     )
 ) -> None:
+    from openapi_client.exceptions import ApiException
+    from openapi_client.models import PostCollectionsRequest
+
     typer.echo(
         f"Attempting to create collection: {collection_name}"
     )
@@ -68,7 +40,7 @@ def create_collection(
             collection_name=collection_name
         )
 
-        mongodb_api.post_collections_mongodb_collections_post(
+        get_mongodb_api().post_collections_mongodb_collections_post(
             post_collections_request=post_collections_request
         )
 
@@ -100,12 +72,14 @@ def delete_collection(
         help="Name of the collection to delete."
     )
 ) -> None:
+    from openapi_client.exceptions import ApiException
+
     typer.echo(
         f"Attempting to delete collection: {collection_name}"
     )
 
     try:
-        mongodb_api.delete_collections_mongodb_collections_collection_name_delete(
+        get_mongodb_api().delete_collections_mongodb_collections_collection_name_delete(
             collection_name=collection_name
         )
 
@@ -137,12 +111,14 @@ def get_collection_indexes(
         help="Name of the collection to retrieve indexes from."
     )
 ) -> None:
+    from openapi_client.exceptions import ApiException
+
     typer.echo(
         f"Getting indexes for collection: {collection_name}"
     )
 
     try:
-        indexes = mongodb_api.get_collections_index_mongodb_collections_collection_name_index_get(
+        indexes = get_mongodb_api().get_collections_index_mongodb_collections_collection_name_index_get(
             collection_name=collection_name
         )
 
@@ -151,10 +127,10 @@ def get_collection_indexes(
                 f"Indexes for '{collection_name}':"
             )
 
-            for idx in indexes:
-                typer.echo(
-                    json.dumps(idx, indent=4)
-                )
+            os.write(
+                sys.stdout.fileno(),
+                orjson.dumps(indexes, option=orjson.OPT_INDENT_2) + b"\n"
+            )
 
         else:
             typer.echo(
@@ -194,6 +170,9 @@ def create_collection_index(
         help="Whether the index should enforce uniqueness."
     )
 ) -> None:
+    from openapi_client.exceptions import ApiException
+    from openapi_client.models import PostCollectionsIndexRequest
+
     typer.echo(
         f"Attempting to create index on collection: {collection_name} with key: {key}, unique: {unique}"
     )
@@ -204,7 +183,7 @@ def create_collection_index(
             unique=unique
         )
 
-        mongodb_api.post_collections_index_mongodb_collections_collection_name_index_post(
+        get_mongodb_api().post_collections_index_mongodb_collections_collection_name_index_post(
             collection_name=collection_name,
             post_collections_index_request=post_collections_index_request
         )
@@ -241,12 +220,14 @@ def delete_collection_index(
         help="Name of the index to delete."
     )
 ) -> None:
+    from openapi_client.exceptions import ApiException
+
     typer.echo(
         f"Attempting to delete index '{index_name}' from collection: {collection_name}"
     )
 
     try:
-        mongodb_api.delete_collections_index_mongodb_collections_collection_name_index_index_name_delete(
+        get_mongodb_api().delete_collections_index_mongodb_collections_collection_name_index_index_name_delete(
             collection_name=collection_name,
             index_name=index_name
         )
@@ -279,12 +260,14 @@ def get_collection_validator(
         help="Name of the collection to retrieve validator from."
     )
 ) -> None:
+    from openapi_client.exceptions import ApiException
+
     typer.echo(
         f"Getting validator for collection: {collection_name}"
     )
 
     try:
-        validator = mongodb_api.get_collections_validator_mongodb_collections_collection_name_validator_get(
+        validator = get_mongodb_api().get_collections_validator_mongodb_collections_collection_name_validator_get(
             collection_name=collection_name
         )
 
@@ -294,7 +277,7 @@ def get_collection_validator(
             )
 
             typer.echo(
-                json.dumps(validator, indent=2)
+                orjson.dumps(validator, option=orjson.OPT_INDENT_2).decode()
             )
 
         else:
@@ -339,6 +322,9 @@ def update_collection_validator(
         help="Validation action: 'error' or 'warn'."
     )
 ) -> None:
+    from openapi_client.exceptions import ApiException
+    from openapi_client.models import PutCollectionsValidatorRequest
+
     typer.echo(
         f"Updating validator for collection: {collection_name}"
     )
@@ -350,7 +336,7 @@ def update_collection_validator(
             validation_action=validation_action
         )
 
-        mongodb_api.put_collections_validator_mongodb_collections_collection_name_validator_put(
+        get_mongodb_api().put_collections_validator_mongodb_collections_collection_name_validator_put(
             collection_name=collection_name,
             put_collections_validator_request=put_collections_validator_request
         )
@@ -383,12 +369,14 @@ def get_collection_validator_summary(
         help="Name of the collection to get validator error summary from."
     )
 ) -> None:
+    from openapi_client.exceptions import ApiException
+
     typer.echo(
         f"Getting validator error summary for collection: {collection_name}"
     )
 
     try:
-        summary = mongodb_api.get_collections_validator_validation_error_summary_mongodb_collections_collection_name_validator_validation_error_summary_get(
+        summary = get_mongodb_api().get_collections_validator_validation_error_summary_mongodb_collections_collection_name_validator_validation_error_summary_get(
             collection_name=collection_name
         )
 
@@ -397,8 +385,9 @@ def get_collection_validator_summary(
                 f"Validator error summary for '{collection_name}':"
             )
 
-            typer.echo(
-                json.dumps(summary, indent=4)
+            os.write(
+                sys.stdout.fileno(),
+                orjson.dumps(summary, option=orjson.OPT_INDENT_2) + b"\n"
             )
 
         else: